@@ -1,14 +1,81 @@
 """Command execution module for running shell commands asynchronously."""
 
 import asyncio
+import os
+import shutil
+import subprocess
+import sys
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from dataclasses import dataclass
-from typing import Optional
+from dataclasses import dataclass, field
+from typing import Optional, Union
 
 from .platform_detector import PlatformInfo, PlatformDetector
 
 
-@dataclass
+# Shells whose "&&" operator runs the next command only if the previous one
+# succeeded (Windows PowerShell 5.1 has no "&&", so it is not listed)
+_AND_CHAIN_SHELLS = frozenset({"bash", "sh", "pwsh", "cmd"})
+
+# Shells in which "{ command\n}" groups a command as a unit, so comments,
+# separators and trailing "&" inside it cannot reach the next command
+_GROUPING_SHELLS = frozenset({"bash", "sh"})
+
+# Characters (newlines, separators, comments, escapes) that let a cmd or pwsh
+# command interact with the "&&" chain it is joined into
+_UNCHAINABLE_CHARACTERS = frozenset("\n\r&|;#^`")
+
+# Shells whose simple commands may be executed directly, without the shell
+_DIRECT_EXEC_SHELLS = frozenset({"bash", "sh"})
+
+# Characters that only a shell interprets (quoting, expansion, redirection,
+# job control, comments, command separators). Whitespace other than space and
+# tab is included too: the shell splits words on those two only, while
+# str.split() also splits on e.g. vertical tab and no-break space.
+_SHELL_METACHARACTERS = frozenset(
+    "|&;<>()$`\\\"'*?[]{}#~=%!"
+    "\n\v\f\r\x1c\x1d\x1e\x1f\x85\xa0\u1680\u2000\u2001\u2002\u2003\u2004"
+    "\u2005\u2006\u2007\u2008\u2009\u200a\u2028\u2029\u202f\u205f\u3000"
+)
+
+# Bash builtins and reserved words (compgen -b, compgen -k), which the shell
+# never looks up in PATH. Several, like echo and test, also exist as
+# executables that behave differently.
+_SHELL_ONLY_WORDS = frozenset({
+    "!", ".", ":", "[", "[[", "]]", "{", "}", "alias", "bg", "bind", "break",
+    "builtin", "caller", "case", "cd", "command", "compgen", "complete",
+    "compopt", "continue", "coproc", "declare", "dirs", "disown", "do",
+    "done", "echo", "elif", "else", "enable", "esac", "eval", "exec", "exit",
+    "export", "false", "fc", "fg", "fi", "for", "function", "getopts",
+    "hash", "help", "history", "if", "in", "jobs", "kill", "let", "local",
+    "logout", "mapfile", "popd", "printf", "pushd", "pwd", "read",
+    "readarray", "readonly", "return", "select", "set", "shift", "shopt",
+    "source", "suspend", "test", "then", "time", "times", "trap", "true",
+    "type", "typeset", "ulimit", "umask", "unalias", "unset", "until",
+    "wait", "while",
+})
+
+# Maximum number of merged environments kept per executor
+_ENV_CACHE_SIZE = 16
+
+# Output beyond the first and last megabyte of a stream is dropped while it is
+# read, so long-running commands cannot grow the result without bound
+_OUTPUT_HEAD_BYTES = 1024 * 1024
+_OUTPUT_TAIL_BYTES = 1024 * 1024
+_READ_CHUNK_BYTES = 64 * 1024
+
+# Subprocesses are started from this pool so fork/exec never runs on the event
+# loop thread. Only POSIX pipes can be attached to the loop afterwards, so
+# Windows keeps using asyncio's own subprocess support.
+_SPAWN_POOL: Optional[ThreadPoolExecutor] = (
+    None
+    if sys.platform == "win32"
+    else ThreadPoolExecutor(max_workers=4, thread_name_prefix="bash-skill-spawn")
+)
+
+
+@dataclass(slots=True, frozen=True)
 class ExecutionResult:
     """Result of a command execution."""
 
@@ -17,6 +84,214 @@ class ExecutionResult:
     stderr: str
     success: bool
     timed_out: bool = False
+    # Undecoded stdout, kept so parsers can consume the bytes directly
+    stdout_bytes: Optional[bytes] = field(default=None, repr=False, compare=False)
+
+
+class _SpawnedProcess:
+    """Subset of asyncio.subprocess.Process for a Popen started off the loop."""
+
+    def __init__(
+        self,
+        popen: subprocess.Popen,
+        stdout: asyncio.StreamReader,
+        stderr: asyncio.StreamReader,
+        transports: tuple[asyncio.ReadTransport, ...],
+    ):
+        self._popen = popen
+        self._transports = transports
+        self.stdout = stdout
+        self.stderr = stderr
+
+    @property
+    def returncode(self) -> Optional[int]:
+        return self._popen.returncode
+
+    async def wait(self) -> int:
+        """Wait for the process to exit without blocking the event loop."""
+        if self._popen.returncode is None:
+            loop = asyncio.get_running_loop()
+            if not await self._wait_pidfd(loop):
+                await loop.run_in_executor(None, self._popen.wait)
+        # The process has been reaped, so this returns without blocking
+        return self._popen.wait()
+
+    async def _wait_pidfd(self, loop: asyncio.AbstractEventLoop) -> bool:
+        """Wait for exit by polling a Linux pidfd on the event loop.
+
+        This avoids parking a thread in waitpid() for every running process.
+
+        Returns:
+            True if the process was reaped, False if pidfds are unavailable.
+        """
+        if not hasattr(os, "pidfd_open"):
+            return False
+        try:
+            pidfd = os.pidfd_open(self._popen.pid)
+        except OSError:
+            # Kernel older than 5.3, or not permitted
+            return False
+
+        exited = loop.create_future()
+        loop.add_reader(pidfd, lambda: exited.done() or exited.set_result(None))
+        try:
+            await exited
+        finally:
+            loop.remove_reader(pidfd)
+            os.close(pidfd)
+
+        # The pidfd is readable once the process has exited, so this returns
+        # without blocking
+        self._popen.wait()
+        return True
+
+    def kill(self) -> None:
+        """Kill the process and stop reading its pipes."""
+        self._popen.kill()
+        for transport in self._transports:
+            transport.close()
+
+
+def _is_chainable(command: str) -> bool:
+    """Check whether a cmd or pwsh command can safely be joined with "&&".
+
+    Rejects separators, comments, escapes and line breaks, cmd's "rem" and
+    "::" comments, and pwsh's "--%" stop-parsing token, all of which would
+    change how the rest of the chain is parsed.
+    """
+    if not _UNCHAINABLE_CHARACTERS.isdisjoint(command) or "--%" in command:
+        return False
+    words = command.split(None, 1)
+    return bool(words) and words[0].lower() != "rem" and not words[0].startswith("::")
+
+
+async def _read_capped(stream: asyncio.StreamReader) -> bytes:
+    """Read a stream to EOF, keeping only its head and tail.
+
+    The first _OUTPUT_HEAD_BYTES are kept as read. After that, chunks go into
+    a deque that drops its oldest chunks once it holds more than
+    _OUTPUT_TAIL_BYTES. Dropped bytes are replaced by a marker line.
+
+    Args:
+        stream: The stream to read.
+
+    Returns:
+        The captured bytes.
+    """
+    head: list[bytes] = []
+    head_size = 0
+    tail: deque[bytes] = deque()
+    tail_size = 0
+    dropped = 0
+
+    while chunk := await stream.read(_READ_CHUNK_BYTES):
+        if head_size < _OUTPUT_HEAD_BYTES:
+            kept = chunk[:_OUTPUT_HEAD_BYTES - head_size]
+            head.append(kept)
+            head_size += len(kept)
+            chunk = chunk[len(kept):]
+            if not chunk:
+                continue
+
+        tail.append(chunk)
+        tail_size += len(chunk)
+        while tail_size - len(tail[0]) >= _OUTPUT_TAIL_BYTES:
+            oldest = tail.popleft()
+            tail_size -= len(oldest)
+            dropped += len(oldest)
+
+    if tail_size > _OUTPUT_TAIL_BYTES:
+        excess = tail_size - _OUTPUT_TAIL_BYTES
+        tail[0] = tail[0][excess:]
+        dropped += excess
+
+    if not dropped:
+        return b"".join(head) + b"".join(tail)
+    marker = f"\n... [{dropped} bytes truncated] ...\n".encode()
+    return b"".join(head) + marker + b"".join(tail)
+
+
+def _popen(
+    args: tuple[str, ...],
+    cwd: Optional[Path],
+    env: Optional[dict[str, str]],
+    direct_args: Optional[tuple[str, ...]],
+) -> subprocess.Popen:
+    """Start a subprocess with piped output; runs in _SPAWN_POOL.
+
+    When direct_args is given, its program is looked up in PATH here, off the
+    event loop, and executed without the shell. If it is not found (or cannot
+    be executed, like a script without a shebang line) args runs instead, so
+    the shell reports the error or runs the script itself.
+    """
+    if direct_args is not None:
+        path = (os.environ if env is None else env).get("PATH", os.defpath)
+        executable = shutil.which(direct_args[0], path=path)
+        # A relative match would be resolved against our cwd, not the command's
+        if executable is not None and os.path.isabs(executable):
+            try:
+                return subprocess.Popen(
+                    direct_args,
+                    executable=executable,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.PIPE,
+                    cwd=cwd,
+                    env=env,
+                )
+            except OSError:
+                pass
+
+    return subprocess.Popen(
+        args,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        cwd=cwd,
+        env=env,
+    )
+
+
+async def _spawn(
+    args: tuple[str, ...],
+    cwd: Optional[Path],
+    env: Optional[dict[str, str]],
+    direct_args: Optional[tuple[str, ...]] = None,
+) -> Union[asyncio.subprocess.Process, _SpawnedProcess]:
+    """Start a subprocess with stdout and stderr piped back to the event loop.
+
+    Args:
+        args: Program and arguments to execute.
+        cwd: Working directory for the process (optional).
+        env: Environment for the process (optional).
+        direct_args: Equivalent arguments to try first without the shell, on
+            POSIX only (optional).
+
+    Returns:
+        A process object exposing stdout, stderr, returncode, wait() and
+        kill().
+    """
+    if _SPAWN_POOL is None:
+        return await asyncio.create_subprocess_exec(
+            *args,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            cwd=cwd,
+            env=env,
+        )
+
+    loop = asyncio.get_running_loop()
+    popen = await loop.run_in_executor(
+        _SPAWN_POOL, _popen, args, cwd, env, direct_args
+    )
+
+    stdout = asyncio.StreamReader()
+    stderr = asyncio.StreamReader()
+    stdout_transport, _ = await loop.connect_read_pipe(
+        lambda: asyncio.StreamReaderProtocol(stdout), popen.stdout
+    )
+    stderr_transport, _ = await loop.connect_read_pipe(
+        lambda: asyncio.StreamReaderProtocol(stderr), popen.stderr
+    )
+    return _SpawnedProcess(popen, stdout, stderr, (stdout_transport, stderr_transport))
 
 
 class CommandExecutor:
@@ -29,6 +304,10 @@ class CommandExecutor:
             platform_info: Platform information. If None, will auto-detect.
         """
         self.platform_info = platform_info or PlatformDetector.detect()
+        self._cmd_prefix: tuple[str, ...] = tuple(
+            PlatformDetector.get_command_prefix(self.platform_info.shell)
+        )
+        self._env_cache: dict[frozenset[tuple[str, str]], dict[str, str]] = {}
 
     async def execute(
         self,
@@ -48,38 +327,32 @@ class CommandExecutor:
         Returns:
             ExecutionResult: The result of the command execution.
         """
-        # Get the command prefix for the current shell
-        cmd_prefix = PlatformDetector.get_command_prefix(self.platform_info.shell)
-        full_command = cmd_prefix + [command]
-
         # Prepare the working directory
         cwd = Path(working_dir) if working_dir else None
 
         # Prepare environment variables
-        process_env = None
-        if env:
-            import os
-            process_env = os.environ.copy()
-            process_env.update(env)
+        process_env = self._merged_env(env) if env else None
+
+        # Prepend the command prefix for the current shell; simple commands
+        # are also passed split into words, to be run without the shell
+        full_command = (*self._cmd_prefix, command)
+        direct_args = self._direct_args(command)
 
         try:
             # Create the subprocess
-            process = await asyncio.create_subprocess_exec(
-                *full_command,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-                cwd=cwd,
-                env=process_env,
-            )
+            process = await _spawn(full_command, cwd, process_env, direct_args)
+            # Both streams are piped by _spawn()
+            assert process.stdout is not None and process.stderr is not None
 
             # Wait for completion with timeout
             try:
-                stdout_bytes, stderr_bytes = await asyncio.wait_for(
-                    process.communicate(),
-                    timeout=timeout
-                )
-                timed_out = False
-            except asyncio.TimeoutError:
+                async with asyncio.timeout(timeout):
+                    stdout_bytes, stderr_bytes = await asyncio.gather(
+                        _read_capped(process.stdout),
+                        _read_capped(process.stderr),
+                    )
+                    await process.wait()
+            except TimeoutError:
                 # Kill the process on timeout
                 try:
                     process.kill()
@@ -103,7 +376,8 @@ class CommandExecutor:
                 stdout=stdout,
                 stderr=stderr,
                 success=process.returncode == 0,
-                timed_out=False
+                timed_out=False,
+                stdout_bytes=stdout_bytes,
             )
 
         except FileNotFoundError:
@@ -131,12 +405,85 @@ class CommandExecutor:
                 timed_out=False
             )
 
+    def _direct_args(self, command: str) -> Optional[tuple[str, ...]]:
+        """Split a command that may be executed without a POSIX shell.
+
+        A command qualifies when it contains no shell metacharacters, so
+        splitting on spaces and tabs gives exactly the words the shell would
+        pass, and its program is a plain name rather than a builtin or
+        reserved word. Skipping the shell saves starting one extra process
+        per command; whether the program exists in PATH is checked by _popen().
+
+        Args:
+            command: The shell command to execute.
+
+        Returns:
+            The argument vector, or None if the command must run through the
+            shell.
+        """
+        if (
+            self.platform_info.shell not in _DIRECT_EXEC_SHELLS
+            or not _SHELL_METACHARACTERS.isdisjoint(command)
+        ):
+            return None
+
+        args = command.split()
+        if not args or args[0] in _SHELL_ONLY_WORDS or "/" in args[0]:
+            return None
+        return tuple(args)
+
+    def _chain_commands(self, commands: list[str]) -> Optional[str]:
+        """Join commands with "&&" so each runs only if the previous succeeded.
+
+        On bash and sh each command is wrapped in a brace group, so it keeps
+        the meaning it has when run on its own. Other shells have no such
+        grouping, so commands that could interact with the chain are not
+        joined.
+
+        Args:
+            commands: The shell commands to join.
+
+        Returns:
+            The chained command, or None if the commands must run one by one.
+        """
+        shell = self.platform_info.shell
+        if shell in _GROUPING_SHELLS:
+            return " && ".join(f"{{ {command}\n}}" for command in commands)
+        if shell not in _AND_CHAIN_SHELLS or not all(map(_is_chainable, commands)):
+            return None
+        return " && ".join(commands)
+
+    def _merged_env(self, env: dict[str, str]) -> dict[str, str]:
+        """Get the process environment with the given variables overlaid.
+
+        Merged environments are cached per overlay (oldest evicted first), so
+        callers repeating the same overlay reuse one dict. A cached entry
+        reflects os.environ as it was when the entry was built.
+
+        Args:
+            env: Environment variables to overlay on os.environ.
+
+        Returns:
+            The merged environment mapping.
+        """
+        key = frozenset(env.items())
+        process_env = self._env_cache.get(key)
+        if process_env is None:
+            process_env = {**os.environ, **env}
+            if len(self._env_cache) >= _ENV_CACHE_SIZE:
+                del self._env_cache[next(iter(self._env_cache))]
+            self._env_cache[key] = process_env
+        return process_env
+
     async def execute_batch(
         self,
         commands: list[str],
         working_dir: Optional[str] = None,
         timeout: int = 30,
         env: Optional[dict[str, str]] = None,
+        fast_batch: bool = False,
+        parallel: bool = False,
+        max_concurrency: int = 8,
     ) -> list[ExecutionResult]:
         """Execute multiple commands in sequence.
 
@@ -145,10 +492,44 @@ class CommandExecutor:
             working_dir: The working directory for the commands (optional).
             timeout: Maximum execution time per command in seconds (default: 30).
             env: Environment variables to set for the commands (optional).
+            fast_batch: Chain the commands with "&&" and run them in a single
+                shell process when the shell supports it (on cmd and pwsh,
+                only commands without separators, comments or escapes are
+                chained). The batch then yields one combined result and the
+                timeout applies to the whole chain (default: False).
+            parallel: Run the commands concurrently instead of in sequence.
+                Every command runs regardless of failures, and results keep
+                the order of commands. Ignored when fast_batch applies
+                (default: False).
+            max_concurrency: Maximum number of commands running at once when
+                parallel is set (default: 8).
 
         Returns:
-            List[ExecutionResult]: Results of each command execution.
+            List[ExecutionResult]: Results of each command execution, or a
+                single combined result when fast_batch is used.
+
+        Raises:
+            ValueError: If max_concurrency is less than 1.
         """
+        if max_concurrency < 1:
+            raise ValueError(
+                f"max_concurrency must be at least 1, got {max_concurrency}"
+            )
+
+        if fast_batch and len(commands) > 1:
+            chained = self._chain_commands(commands)
+            if chained is not None:
+                return [await self.execute(chained, working_dir, timeout, env)]
+
+        if parallel:
+            semaphore = asyncio.Semaphore(max_concurrency)
+
+            async def run_one(command: str) -> ExecutionResult:
+                async with semaphore:
+                    return await self.execute(command, working_dir, timeout, env)
+
+            return list(await asyncio.gather(*(run_one(c) for c in commands)))
+
         results = []
         for command in commands:
             result = await self.execute(command, working_dir, timeout, env)
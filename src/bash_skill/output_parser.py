@@ -1,16 +1,29 @@
 """Output parsing module for structured command result interpretation."""
 
+import functools
 import json
 import re
-from enum import Enum
+from enum import StrEnum
 from dataclasses import dataclass
-from typing import Optional
+from typing import Any, Iterable, Iterator, Optional, Union
 
 from .command_executor import ExecutionResult
 from .platform_detector import PlatformInfo
 
+# orjson is an optional, faster parser; see _json_loads() for where it is used
+try:
+    from orjson import loads as _orjson_loads
+except ImportError:
+    _orjson_loads = None
 
-class ErrorType(Enum):
+# pyahocorasick lets contains_any() find many patterns in a single pass
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+
+class ErrorType(StrEnum):
     """Classification of error types."""
 
     NONE = "none"
@@ -21,7 +34,7 @@ class ErrorType(Enum):
     TIMEOUT = "timeout"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ParsedResult:
     """Parsed and structured command execution result."""
 
@@ -38,7 +51,8 @@ class ParsedResult:
 class OutputParser:
     """Parses and structures command execution results."""
 
-    # Common error patterns for different shells
+    # Common error phrases for different shells, matched in order as
+    # case-insensitive substrings of stderr
     ERROR_PATTERNS = {
         "command_not_found": [
             r"command not found",
@@ -85,7 +99,9 @@ class OutputParser:
         # Try to parse structured output (JSON)
         parsed_data = None
         if result.stdout.strip():
-            parsed_data = OutputParser.try_parse_json(result.stdout)
+            parsed_data = OutputParser.try_parse_json(
+                result.stdout if result.stdout_bytes is None else result.stdout_bytes
+            )
 
         return ParsedResult(
             exit_code=result.exit_code,
@@ -107,7 +123,8 @@ class OutputParser:
         """Detect and classify the error type from stderr and exit code.
 
         Args:
-            stderr: Standard error output.
+            stderr: Standard error output. Only its last 4096 characters are
+                examined, since shells and tools report errors at the end.
             exit_code: Process exit code.
             timed_out: Whether the command timed out.
 
@@ -118,59 +135,75 @@ class OutputParser:
         if timed_out:
             return ErrorType.TIMEOUT
 
-        # No error if exit code is 0 and stderr is empty
-        if exit_code == 0 and not stderr.strip():
+        # A zero exit code means success, even if stderr has warnings or
+        # progress output
+        if exit_code == 0:
             return ErrorType.NONE
 
-        # Check stderr against error patterns
-        stderr_lower = stderr.lower()
+        # POSIX shells report these failures through reserved exit codes, so
+        # stderr does not need to be scanned
+        if exit_code == 127:
+            return ErrorType.COMMAND_NOT_FOUND
+        if exit_code == 126:
+            return ErrorType.PERMISSION_DENIED
 
-        for error_type, patterns in OutputParser.ERROR_PATTERNS.items():
-            for pattern in patterns:
-                if re.search(pattern.lower(), stderr_lower):
-                    return ErrorType[error_type.upper()]
+        # Lowercase once, then check each phrase with a plain substring test
+        stderr_lower = stderr[-_ERROR_SCAN_CHARS:].lower()
+        for phrase, error_type in _ERROR_PHRASES:
+            if phrase in stderr_lower:
+                return error_type
 
         # Default to runtime error
         return ErrorType.RUNTIME_ERROR
 
     @staticmethod
-    def try_parse_json(output: str) -> Optional[dict]:
+    def try_parse_json(output: Union[str, bytes]) -> Optional[dict]:
         """Attempt to parse JSON output.
 
         Args:
-            output: The output string to parse.
+            output: The output to parse, either decoded or as raw UTF-8 bytes.
 
         Returns:
             Parsed JSON dictionary or None if parsing fails.
         """
-        output = output.strip()
-
-        # Try direct JSON parsing
+        # Try direct JSON parsing (surrounding whitespace is valid JSON)
         try:
-            return json.loads(output)
-        except json.JSONDecodeError:
+            return _json_loads(output)
+        except ValueError:
             pass
 
-        # Try to extract JSON from output (handles cases with surrounding text)
-        # Match complete JSON objects
-        json_pattern = r'\{[^{}]*(?:\{[^{}]*\}[^{}]*)*\}'
-        matches = re.findall(json_pattern, output, re.DOTALL)
-
-        for match in matches:
+        if isinstance(output, bytes):
+            output = output.decode("utf-8", errors="replace")
+
+        # Locate the first opening bracket with plain find() calls, so output
+        # without any JSON never reaches the span scanner
+        start = output.find("{")
+        bracket = output.find("[", 0, len(output) if start == -1 else start)
+        if bracket != -1:
+            start = bracket
+        if start == -1:
+            return None
+        opener = output[start]
+
+        # Common case: a single JSON document wrapped in log lines. Try the
+        # outermost candidate once before scanning spans bracket by bracket
+        end = output.rfind("}" if opener == "{" else "]")
+        if end > start:
             try:
-                return json.loads(match)
-            except json.JSONDecodeError:
-                continue
-
-        # Try to extract JSON arrays
-        array_pattern = r'\[[^\[\]]*(?:\[[^\[\]]*\][^\[\]]*)*\]'
-        matches = re.findall(array_pattern, output, re.DOTALL)
+                data = _json_loads(output[start:end + 1])
+            except ValueError:
+                pass
+            else:
+                return data if opener == "{" else {"data": data}
 
-        for match in matches:
+        # Try to extract JSON from output (handles cases with surrounding text)
+        for span in _iter_json_spans(output, start):
             try:
-                return {"data": json.loads(match)}
-            except json.JSONDecodeError:
+                data = _json_loads(span)
+            except ValueError:
                 continue
+            # Wrap JSON arrays so callers always receive a dictionary
+            return data if span[0] == "{" else {"data": data}
 
         return None
 
@@ -194,16 +227,12 @@ class OutputParser:
         if result.error_type != ErrorType.NONE:
             lines.append(f"Error Type: {result.error_type.value}")
 
-        if result.stdout.strip():
-            stdout_preview = result.stdout.strip()[:200]
-            if len(result.stdout) > 200:
-                stdout_preview += "..."
+        stdout_preview = _preview(result.stdout)
+        if stdout_preview:
             lines.append(f"\nStdout:\n{stdout_preview}")
 
-        if result.stderr.strip():
-            stderr_preview = result.stderr.strip()[:200]
-            if len(result.stderr) > 200:
-                stderr_preview += "..."
+        stderr_preview = _preview(result.stderr)
+        if stderr_preview:
             lines.append(f"\nStderr:\n{stderr_preview}")
 
         if result.parsed_data:
@@ -228,19 +257,20 @@ class OutputParser:
         """
         pairs = {}
 
-        # Pattern for KEY=value, KEY: value, KEY = value
-        patterns = [
-            r'^\s*([A-Za-z_][A-Za-z0-9_]*)\s*=\s*(.+?)\s*$',
-            r'^\s*([A-Za-z_][A-Za-z0-9_]*)\s*:\s*(.+?)\s*$',
-        ]
-
         for line in output.splitlines():
-            for pattern in patterns:
-                match = re.match(pattern, line.strip())
-                if match:
-                    key, value = match.groups()
-                    pairs[key] = value.strip()
-                    break
+            # Split at whichever separator comes first; the colon search is
+            # bounded by the position of the first "="
+            pos = line.find("=")
+            colon = line.find(":", 0, len(line) if pos == -1 else pos)
+            if colon != -1:
+                pos = colon
+            if pos == -1:
+                continue
+
+            key = line[:pos].strip()
+            value = line[pos + 1:].strip()
+            if value and key.isidentifier() and key.isascii():
+                pairs[key] = value
 
         return pairs
 
@@ -264,7 +294,7 @@ class OutputParser:
         # Try to detect the separator line
         separator_idx = -1
         for i, line in enumerate(lines):
-            if re.match(r'^[\s\-\+\|]+$', line):
+            if not line.strip(_TABLE_SEP_CHARS):
                 separator_idx = i
                 break
 
@@ -279,10 +309,32 @@ class OutputParser:
         # Strategy 1: Pipe-separated
         if '|' in headers_line:
             headers = [h.strip() for h in headers_line.split('|') if h.strip()]
+
+            # Column offsets from the separator line let aligned rows be
+            # sliced directly instead of split into throwaway lists. Only rows
+            # whose pipes are exactly at the delimiter offsets qualify, so
+            # slicing yields the same cells as splitting on "|".
+            separator = lines[separator_idx]
+            delimiters, spans = _table_layout(separator)
+            fixed_width = len(spans) == len(headers)
+
             result = []
             for row in rows_lines:
                 if '|' not in row:
                     continue
+                if (
+                    fixed_width
+                    and len(row) == len(separator)
+                    and row.count("|") == len(delimiters)
+                    and all(row[i] == "|" for i in delimiters)
+                ):
+                    record = {
+                        header: row[start:end].strip()
+                        for header, (start, end) in zip(headers, spans)
+                    }
+                    if all(record.values()):
+                        result.append(record)
+                    continue
                 values = [v.strip() for v in row.split('|') if v.strip()]
                 if len(values) == len(headers):
                     result.append(dict(zip(headers, values)))
@@ -298,3 +350,235 @@ class OutputParser:
                 values = values[:len(headers)]
                 result.append(dict(zip(headers, values)))
         return result
+
+    @staticmethod
+    def contains_any(
+        text: str,
+        patterns: Iterable[str],
+        ignore_case: bool = False
+    ) -> set[str]:
+        """Find which of several substrings occur in a text.
+
+        With pyahocorasick installed the text is scanned once for all patterns;
+        otherwise each pattern is searched for with ``in``.
+
+        Args:
+            text: The text to search, e.g. command stdout.
+            patterns: Substrings to look for.
+            ignore_case: Compare case-insensitively (using str.casefold()).
+
+        Returns:
+            The subset of patterns found in the text.
+        """
+        patterns = frozenset(patterns)
+        if ignore_case:
+            text = text.casefold()
+
+        if ahocorasick is None:
+            if ignore_case:
+                return {p for p in patterns if p.casefold() in text}
+            return {p for p in patterns if p in text}
+
+        # The empty string occurs in every text but cannot be added to an automaton
+        found = {p for p in patterns if not p}
+        automaton = _pattern_automaton(patterns, ignore_case)
+        if automaton is not None:
+            remaining = len(patterns) - len(found)
+            for _, matched in automaton.iter(text):
+                if matched.isdisjoint(found):
+                    found |= matched
+                    remaining -= len(matched)
+                    if not remaining:
+                        break
+        return found
+
+
+# Number of trailing stderr characters examined by detect_error_type
+_ERROR_SCAN_CHARS = 4096
+
+# Flattened ``OutputParser.ERROR_PATTERNS``, in priority order
+_ERROR_PHRASES: tuple[tuple[str, ErrorType], ...] = tuple(
+    (phrase.lower(), ErrorType[error_type.upper()])
+    for error_type, phrases in OutputParser.ERROR_PATTERNS.items()
+    for phrase in phrases
+)
+
+# orjson turns integers outside the 64-bit range into floats; such an integer
+# has at least 19 digits
+_LONG_NUMBER_RE = re.compile(r"[0-9]{19}")
+_LONG_NUMBER_BYTES_RE = re.compile(rb"[0-9]{19}")
+
+# Characters that matter when scanning for JSON spans, outside and inside
+# string literals; everything else is skipped by the regex engine rather than
+# inspected one by one in Python.
+_JSON_TOKEN_RE = re.compile(r'[][{}"]')
+_JSON_STRING_TOKEN_RE = re.compile(r'["\\\n]')
+
+# A separator line consists only of these characters, e.g. "|---|:--:|" or
+# "------+-----"; stripping them leaves nothing
+_TABLE_SEP_CHARS = " \t\f\v-+|:"
+
+
+@functools.lru_cache(maxsize=32)
+def _pattern_automaton(patterns: frozenset[str], ignore_case: bool):
+    """Build an Aho-Corasick automaton for contains_any(), or None if empty.
+
+    Each key maps to the set of original patterns that share it, since several
+    patterns can casefold to the same key.
+    """
+    originals: dict[str, set[str]] = {}
+    for pattern in patterns:
+        if pattern:
+            key = pattern.casefold() if ignore_case else pattern
+            originals.setdefault(key, set()).add(pattern)
+    if not originals:
+        return None
+
+    # Only called by contains_any() when pyahocorasick is installed
+    assert ahocorasick is not None
+    automaton = ahocorasick.Automaton()
+    for key, group in originals.items():
+        automaton.add_word(key, frozenset(group))
+    automaton.make_automaton()
+    return automaton
+
+
+def _json_loads(text: Union[str, bytes]) -> Any:
+    """Parse JSON, with the same result json.loads() would give.
+
+    orjson is used when installed, except for text with 19+ digit numbers,
+    which orjson may parse into lossy floats. Text orjson rejects (NaN,
+    Infinity, out-of-range floats) is retried with json.loads().
+
+    Raises:
+        ValueError: If the text is not valid JSON, or nested too deeply for
+            json.loads() to parse.
+    """
+    if _orjson_loads is not None:
+        if isinstance(text, bytes):
+            has_long_number = _LONG_NUMBER_BYTES_RE.search(text) is not None
+        else:
+            has_long_number = _LONG_NUMBER_RE.search(text) is not None
+        if not has_long_number:
+            try:
+                return _orjson_loads(text)
+            except ValueError:
+                pass
+    try:
+        return json.loads(text)
+    except RecursionError:
+        raise ValueError("JSON nested too deeply") from None
+
+
+def _preview(text: str, limit: int = 200) -> str:
+    """Build a stripped preview of at most limit characters.
+
+    Only a bounded head of the text is stripped, so the cost does not grow
+    with the size of the output.
+
+    Args:
+        text: The text to preview.
+        limit: Maximum number of characters to keep.
+
+    Returns:
+        The preview, with "..." appended if the text is longer than limit,
+        or an empty string if the text is blank.
+    """
+    # Fall back to the whole text only if its head is entirely whitespace
+    preview = text[:2 * limit].strip() or text.strip()
+    if not preview:
+        return ""
+    ellipsis = "..." if len(text) > limit else ""
+    return f"{preview[:limit]}{ellipsis}"
+
+
+def _iter_json_spans(text: str, start: int = 0) -> Iterator[str]:
+    """Yield balanced ``{...}`` and ``[...]`` spans of text in order.
+
+    Single left-to-right scan that tracks bracket nesting and ignores brackets
+    inside JSON string literals. Balanced spans nested in a bracket that is
+    never closed (or closed by the wrong bracket) are still yielded, so a stray
+    ``[`` in a log line does not hide the JSON that follows it. A string
+    literal cannot contain a raw newline, so reaching one inside a "string"
+    means the enclosing brackets were ordinary text (as in ``near "[" at``)
+    and the scan starts over on the next line.
+
+    Args:
+        text: The text to scan.
+        start: Offset at which to begin scanning.
+
+    Yields:
+        Candidate JSON substrings, outermost balanced spans only.
+    """
+    # Open brackets as (position, expected closing bracket)
+    stack: list[tuple[int, str]] = []
+    # Balanced spans found inside a bracket that is still open
+    pending: list[tuple[int, int]] = []
+    in_string = False
+    pos = start
+
+    while True:
+        token_re = _JSON_STRING_TOKEN_RE if in_string else _JSON_TOKEN_RE
+        match = token_re.search(text, pos)
+        if match is None:
+            break
+        i = match.start()
+        char = match.group()
+        pos = i + 1
+
+        if in_string:
+            if char == "\\":
+                # Skip the escaped character
+                pos = i + 2
+            elif char == '"':
+                in_string = False
+            elif char == "\n":
+                in_string = False
+                stack.clear()
+                for span_start, span_end in pending:
+                    yield text[span_start:span_end]
+                pending.clear()
+        elif char == "{" or char == "[":
+            stack.append((i, "}" if char == "{" else "]"))
+        elif char == "}" or char == "]":
+            if stack and stack[-1][1] == char:
+                span_start = stack.pop()[0]
+                if not stack:
+                    pending.clear()
+                    yield text[span_start:i + 1]
+                    continue
+                while pending and pending[-1][0] > span_start:
+                    pending.pop()
+                pending.append((span_start, i + 1))
+            else:
+                stack.clear()
+                for span_start, span_end in pending:
+                    yield text[span_start:span_end]
+                pending.clear()
+        elif char == '"' and stack:
+            in_string = True
+
+    for span_start, span_end in pending:
+        yield text[span_start:span_end]
+
+
+def _table_layout(
+    separator: str,
+) -> tuple[tuple[int, ...], tuple[tuple[int, int], ...]]:
+    """Compute column positions from a table separator line.
+
+    Args:
+        separator: A separator line such as ``|----|----|`` or ``----+----``.
+
+    Returns:
+        The offsets of the column delimiters (``|`` or ``+``) and the
+        ``(start, end)`` slice of each column between them.
+    """
+    delimiters = tuple(i for i, char in enumerate(separator) if char in "|+")
+    bounds = (-1, *delimiters, len(separator))
+    spans = tuple(
+        (left + 1, right)
+        for left, right in zip(bounds, bounds[1:])
+        if right > left + 1
+    )
+    return delimiters, spans
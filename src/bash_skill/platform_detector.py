@@ -1,13 +1,27 @@
 """Platform detection module for cross-platform shell command execution."""
 
+import functools
 import platform
 import shutil
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from typing import Literal
 from dataclasses import dataclass
 
 
-@dataclass
+# The operating system cannot change while the process runs
+_SYSTEM_NAME = platform.system()
+
+# Command prefix used to run a command string through each supported shell
+_SHELL_COMMANDS: dict[str, tuple[str, ...]] = {
+    "cmd": ("cmd", "/c"),
+    "powershell": ("powershell", "-Command"),
+    "pwsh": ("pwsh", "-Command"),
+    "bash": ("bash", "-c"),
+    "sh": ("sh", "-c"),
+}
+
+@dataclass(slots=True, frozen=True)
 class PlatformInfo:
     """Platform information data class."""
 
@@ -20,13 +34,16 @@ class PlatformDetector:
     """Detects the current platform and available shells."""
 
     @staticmethod
+    @functools.lru_cache(maxsize=1)
     def detect() -> PlatformInfo:
         """Detect the current platform and return platform information.
 
+        The result is cached for the lifetime of the process.
+
         Returns:
             PlatformInfo: Information about the detected platform and shell.
         """
-        system = platform.system()
+        system = _SYSTEM_NAME
 
         if system == "Windows":
             return PlatformDetector._detect_windows()
@@ -39,6 +56,12 @@ class PlatformDetector:
                 shell_available=False
             )
 
+    @staticmethod
+    def invalidate_cache() -> None:
+        """Clear the cached results of detect() and get_available_shells()."""
+        PlatformDetector.detect.cache_clear()
+        PlatformDetector._probe_shells.cache_clear()
+
     @staticmethod
     def _detect_windows() -> PlatformInfo:
         """Detect shell on Windows systems.
@@ -109,25 +132,37 @@ class PlatformDetector:
         Raises:
             ValueError: If the shell type is unknown.
         """
-        shell_commands = {
-            "cmd": ["cmd", "/c"],
-            "powershell": ["powershell", "-Command"],
-            "pwsh": ["pwsh", "-Command"],
-            "bash": ["bash", "-c"],
-            "sh": ["sh", "-c"],
-        }
-
-        if shell not in shell_commands:
-            raise ValueError(f"Unknown shell type: {shell}")
-
-        return shell_commands[shell]
+        try:
+            return list(_SHELL_COMMANDS[shell])
+        except KeyError:
+            raise ValueError(f"Unknown shell type: {shell}") from None
 
     @staticmethod
     def get_available_shells() -> dict[str, bool]:
         """Get all available shells on the current system.
 
+        The probe result is cached for the lifetime of the process; each call
+        returns a new dictionary, so callers may modify it.
+
         Returns:
             Dictionary mapping shell names to availability status.
         """
+        return dict(PlatformDetector._probe_shells())
+
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def _probe_shells() -> tuple[tuple[str, bool], ...]:
+        """Probe PATH for each supported shell.
+
+        Returns:
+            Pairs of shell name and availability status.
+        """
         shells = ["cmd", "powershell", "pwsh", "bash", "sh"]
-        return {shell: shutil.which(shell) is not None for shell in shells}
+        if _SYSTEM_NAME == "Windows":
+            # Each lookup stats several PATHEXT candidates per PATH entry,
+            # which can take tens of milliseconds on AV-scanned filesystems
+            with ThreadPoolExecutor(max_workers=len(shells)) as pool:
+                paths = list(pool.map(shutil.which, shells))
+        else:
+            paths = [shutil.which(shell) for shell in shells]
+        return tuple((shell, path is not None) for shell, path in zip(shells, paths))
@@ -1,12 +1,15 @@
 """MCP Server for cross-platform shell command execution."""
 
+import asyncio
+import os
+
 from mcp.server.fastmcp import FastMCP
 from pydantic import BaseModel, Field
 from typing import Literal, Optional
 
-from .platform_detector import PlatformDetector, PlatformInfo
+from .platform_detector import PlatformDetector
 from .command_executor import CommandExecutor
-from .output_parser import OutputParser, ErrorType
+from .output_parser import OutputParser
 
 
 # Create MCP server
@@ -52,18 +55,33 @@ class ShellInfo(BaseModel):
     available_shells: dict[str, bool] = Field(description="Available shells and their status")
 
 
+def _batch_concurrency() -> int:
+    """Read BASH_SKILL_BATCH_CONCURRENCY, defaulting to the CPU count.
+
+    Values that are not integers fall back to the default; values below 1
+    are raised to 1.
+    """
+    default = os.cpu_count() or 4
+    try:
+        value = int(os.getenv("BASH_SKILL_BATCH_CONCURRENCY", default))
+    except ValueError:
+        return default
+    return max(1, value)
+
+
+# Maximum number of commands run at once by execute_batch(parallel=True)
+_BATCH_CONCURRENCY = _batch_concurrency()
+
 # Global state
-_platform_info: Optional[PlatformInfo] = None
 _executor: Optional[CommandExecutor] = None
 
 
 def _get_executor() -> CommandExecutor:
     """Get or create the command executor instance."""
-    global _platform_info, _executor
+    global _executor
 
     if _executor is None:
-        _platform_info = PlatformDetector.detect()
-        _executor = CommandExecutor(_platform_info)
+        _executor = CommandExecutor(PlatformDetector.detect())
 
     return _executor
 
@@ -142,15 +160,19 @@ async def execute_batch(
     commands: list[str],
     working_dir: Optional[str] = None,
     timeout: int = 30,
+    parallel: bool = False,
 ) -> list[CommandResult]:
     """Execute multiple commands in sequence.
 
     Executes a list of commands one after another. Stops if a command fails.
+    With parallel=True, independent commands run concurrently instead and
+    every command runs regardless of failures.
 
     Args:
         commands: List of shell commands to execute
         working_dir: Working directory (optional)
         timeout: Timeout in seconds per command (default: 30)
+        parallel: Run the commands concurrently (default: False)
 
     Returns:
         List[CommandResult]: Results for each executed command
@@ -161,6 +183,8 @@ async def execute_batch(
         commands=commands,
         working_dir=working_dir,
         timeout=timeout,
+        parallel=parallel,
+        max_concurrency=_BATCH_CONCURRENCY,
     )
 
     return [
@@ -181,6 +205,16 @@ async def execute_batch(
     ]
 
 
+def _use_uvloop() -> None:
+    """Run the server on uvloop when it is installed (it does not support Windows)."""
+    try:
+        import uvloop
+    except ImportError:
+        return
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+
 # Main entry point
 if __name__ == "__main__":
+    _use_uvloop()
     mcp.run()
@@ -1,6 +1,10 @@
 """Tests for the command executor module."""
 
+import os
+import subprocess
+
 import pytest
+from bash_skill import command_executor
 from bash_skill.platform_detector import PlatformInfo, PlatformDetector
 from bash_skill.command_executor import CommandExecutor, ExecutionResult
 
@@ -52,6 +56,74 @@ class TestCommandExecutor:
         assert result.timed_out is False
         assert "hello" in result.stdout.lower()
 
+    @pytest.mark.asyncio
+    async def test_execute_shell_builtin(self, executor):
+        """Test that shell builtins still run through the shell."""
+        if executor.platform_info.system == "Windows":
+            pytest.skip("uses POSIX shell builtins")
+
+        result = await executor.execute("exit 3")
+        assert result.exit_code == 3
+
+        result = await executor.execute("cd /")
+        assert result.success is True
+
+    def test_direct_args(self):
+        """Test which commands may be executed without the shell."""
+        executor = CommandExecutor(PlatformInfo("Linux", "bash", True))
+
+        assert executor._direct_args("ls -l\t/tmp") == ("ls", "-l", "/tmp")
+        assert executor._direct_args("ls *.txt") is None
+        assert executor._direct_args("ls a\xa0b") is None
+        assert executor._direct_args("ls a\vb") is None
+        assert executor._direct_args("echo --version") is None
+        assert executor._direct_args("./run.sh") is None
+        assert executor._direct_args("   ") is None
+
+        executor = CommandExecutor(PlatformInfo("Windows", "cmd", True))
+        assert executor._direct_args("dir") is None
+
+    @pytest.mark.asyncio
+    async def test_execute_direct_command(self, executor, monkeypatch):
+        """Test that a simple command runs without the shell."""
+        if executor.platform_info.shell not in ("bash", "sh"):
+            pytest.skip("direct execution is POSIX only")
+
+        calls = []
+        popen = subprocess.Popen
+
+        def recording_popen(args, **kwargs):
+            calls.append(tuple(args))
+            return popen(args, **kwargs)
+
+        monkeypatch.setattr(command_executor.subprocess, "Popen", recording_popen)
+        result = await executor.execute("ls -d /")
+
+        assert result.stdout == "/\n"
+        assert calls == [("ls", "-d", "/")]
+
+    @pytest.mark.asyncio
+    async def test_execute_direct_matches_shell(self, executor, tmp_path):
+        """Test that the direct path prints what the shell would."""
+        if executor.platform_info.shell not in ("bash", "sh"):
+            pytest.skip("direct execution is POSIX only")
+
+        # Builtins win over executables of the same name
+        result = await executor.execute("echo --version")
+        assert result.stdout == "--version\n"
+
+        # Only spaces and tabs separate words
+        result = await executor.execute("echo a\xa0b")
+        assert result.stdout == "a\xa0b\n"
+
+        # A script without a shebang line is run by the shell
+        script = tmp_path / "bash_skill_no_shebang"
+        script.write_text("echo from-script\n")
+        script.chmod(0o755)
+        path = f"{tmp_path}{os.pathsep}{os.environ['PATH']}"
+        result = await executor.execute(script.name, env={"PATH": path})
+        assert result.stdout == "from-script\n"
+
     @pytest.mark.asyncio
     async def test_execute_invalid_command(self, executor):
         """Test executing an invalid command."""
@@ -60,6 +132,20 @@ class TestCommandExecutor:
         assert result.success is False
         assert len(result.stderr) > 0 or result.exit_code != 0
 
+    @pytest.mark.asyncio
+    async def test_execute_with_env(self, executor):
+        """Test executing a command with extra environment variables."""
+        if executor.platform_info.shell == "cmd":
+            command = "echo %BASH_SKILL_TEST%"
+        elif executor.platform_info.shell in ("powershell", "pwsh"):
+            command = "echo $env:BASH_SKILL_TEST"
+        else:
+            command = "echo $BASH_SKILL_TEST"
+
+        for _ in range(2):
+            result = await executor.execute(command, env={"BASH_SKILL_TEST": "xyzzy"})
+            assert "xyzzy" in result.stdout
+
     @pytest.mark.asyncio
     async def test_execute_with_timeout(self, executor):
         """Test command execution with timeout."""
@@ -75,6 +161,37 @@ class TestCommandExecutor:
         assert result.success is False
         assert "timeout" in result.stderr.lower()
 
+    @pytest.mark.asyncio
+    async def test_execute_does_not_inherit_fds(self, executor):
+        """Test that inheritable descriptors of the server are not passed on."""
+        if not os.path.isdir("/proc/self/fd"):
+            pytest.skip("needs /proc/self/fd")
+
+        read_fd, write_fd = os.pipe()
+        try:
+            os.set_inheritable(write_fd, True)
+            for command in ("ls /proc/self/fd", "ls /proc/self/fd; true"):
+                result = await executor.execute(command)
+                assert result.success is True
+                assert str(write_fd) not in result.stdout.split()
+        finally:
+            os.close(read_fd)
+            os.close(write_fd)
+
+    @pytest.mark.asyncio
+    async def test_execute_truncates_large_output(self, executor):
+        """Test that very large output keeps only its head and tail."""
+        if executor.platform_info.system == "Windows":
+            pytest.skip("uses POSIX utilities")
+
+        result = await executor.execute("head -c 3000000 /dev/zero | tr '\\0' a; echo end")
+
+        assert result.success is True
+        assert "bytes truncated" in result.stdout
+        assert result.stdout.startswith("a" * 1000)
+        assert result.stdout.rstrip().endswith("end")
+        assert len(result.stdout) < 2 * 1024 * 1024 + 100
+
     @pytest.mark.asyncio
     async def test_execute_batch(self, executor):
         """Test batch execution of commands."""
@@ -100,3 +217,62 @@ class TestCommandExecutor:
         assert len(results) == 2  # Stops after invalid_command
         assert results[0].success is True
         assert results[1].success is False
+
+    @pytest.mark.asyncio
+    async def test_execute_batch_fast_batch(self, executor):
+        """Test fast batch execution runs the chain in a single shell."""
+        commands = ["echo hello", "invalid_command_xyz", "echo world"]
+
+        results = await executor.execute_batch(commands, fast_batch=True)
+
+        assert len(results) == 1
+        assert results[0].success is False
+        assert "hello" in results[0].stdout.lower()
+        assert "world" not in results[0].stdout.lower()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("commands", [
+        ["echo one  # first step", "echo two"],
+        ["false; echo a", "echo b"],
+        ["false", "true || echo SHOULD_NOT_RUN"],
+        ["sleep 0 &", "echo b"],
+    ])
+    async def test_execute_batch_fast_batch_matches_sequential(self, executor, commands):
+        """Test that chaining keeps each command's own meaning."""
+        if executor.platform_info.shell not in ("bash", "sh"):
+            pytest.skip("uses POSIX shell syntax")
+
+        sequential = await executor.execute_batch(commands)
+        (chained,) = await executor.execute_batch(commands, fast_batch=True)
+
+        assert chained.stdout == "".join(r.stdout for r in sequential)
+        assert chained.success == (len(sequential) == len(commands) and sequential[-1].success)
+
+    def test_chain_commands_unsafe_on_cmd(self):
+        """Test that cmd commands that would alter the chain are not joined."""
+        executor = CommandExecutor(PlatformInfo("Windows", "cmd", True))
+
+        assert executor._chain_commands(["echo a", "echo b"]) == "echo a && echo b"
+        assert executor._chain_commands(["echo a & echo b", "echo c"]) is None
+        assert executor._chain_commands(["rem note", "echo c"]) is None
+        assert executor._chain_commands(["echo a ^", "echo c"]) is None
+        assert executor._chain_commands(["", "echo c"]) is None
+
+    @pytest.mark.asyncio
+    async def test_execute_batch_parallel(self, executor):
+        """Test parallel batch execution runs every command in order."""
+        commands = ["echo hello", "invalid_command_xyz", "echo world"]
+
+        results = await executor.execute_batch(commands, parallel=True, max_concurrency=2)
+
+        assert len(results) == 3
+        assert results[0].success is True
+        assert results[1].success is False
+        assert "hello" in results[0].stdout.lower()
+        assert "world" in results[2].stdout.lower()
+
+    @pytest.mark.asyncio
+    async def test_execute_batch_rejects_zero_concurrency(self, executor):
+        """Test that a concurrency limit below 1 is rejected."""
+        with pytest.raises(ValueError):
+            await executor.execute_batch(["echo hello"], parallel=True, max_concurrency=0)
@@ -1,5 +1,7 @@
 """Tests for the output parser module."""
 
+import math
+
 import pytest
 from bash_skill.output_parser import OutputParser, ErrorType, ParsedResult
 from bash_skill.command_executor import ExecutionResult
@@ -54,6 +56,11 @@ class TestOutputParser:
         error_type = OutputParser.detect_error_type("", 0, False)
         assert error_type == ErrorType.NONE
 
+    def test_detect_error_type_none_with_stderr(self):
+        """Test a zero exit code is not an error even with noisy stderr."""
+        error_type = OutputParser.detect_error_type("warning: file not found, skipping", 0, False)
+        assert error_type == ErrorType.NONE
+
     def test_detect_error_type_timeout(self):
         """Test error type detection for timeout."""
         error_type = OutputParser.detect_error_type("", -1, True)
@@ -74,6 +81,21 @@ class TestOutputParser:
         error_type = OutputParser.detect_error_type("bash: syntax error near unexpected token", 2, False)
         assert error_type == ErrorType.SYNTAX_ERROR
 
+    def test_detect_error_type_from_exit_code(self):
+        """Test error type detection from reserved shell exit codes."""
+        assert OutputParser.detect_error_type("", 127, False) == ErrorType.COMMAND_NOT_FOUND
+        assert OutputParser.detect_error_type("", 126, False) == ErrorType.PERMISSION_DENIED
+
+    def test_detect_error_type_runtime_error(self):
+        """Test error type detection falls back to runtime error."""
+        error_type = OutputParser.detect_error_type("fatal: something went wrong", 1, False)
+        assert error_type == ErrorType.RUNTIME_ERROR
+
+    def test_error_type_compares_as_string(self):
+        """Test error types compare equal to their string values."""
+        assert ErrorType.COMMAND_NOT_FOUND == "command_not_found"
+        assert ErrorType.NONE.value == "none"
+
     def test_try_parse_json_valid(self):
         """Test JSON parsing with valid JSON."""
         json_str = '{"key": "value", "number": 42}'
@@ -96,6 +118,62 @@ class TestOutputParser:
         assert result is not None
         assert result["key"] == "value"
 
+    def test_try_parse_json_extract_nested_and_arrays(self):
+        """Test extracting nested JSON and JSON arrays from mixed output."""
+        output = 'log [info] {"a": {"b": {"c": "}"}}} tail'
+        result = OutputParser.try_parse_json(output)
+
+        assert result == {"a": {"b": {"c": "}"}}}
+
+        result = OutputParser.try_parse_json("progress [=== items: [1, 2, 3]")
+        assert result == {"data": [1, 2, 3]}
+
+    def test_try_parse_json_trailing_brackets(self):
+        """Test extraction when brackets after the JSON defeat the outer candidate."""
+        output = '{"key": "value"}\ndone {ok}'
+        assert OutputParser.try_parse_json(output) == {"key": "value"}
+
+    def test_try_parse_json_after_quoted_bracket(self):
+        """Test that a quoted bracket in a log line does not hide later JSON."""
+        output = 'parse error near "[" at line 3\n{"status": "ok"}'
+        assert OutputParser.try_parse_json(output) == {"status": "ok"}
+
+        output = 'warning: unmatched "{" in template\n{"a": 1}'
+        assert OutputParser.try_parse_json(output) == {"a": 1}
+
+    def test_try_parse_json_deeply_nested(self, platform_info):
+        """Test that deeply nested brackets are rejected rather than crashing."""
+        output = "log: " + "[" * 3000 + "]" * 3000
+        assert OutputParser.try_parse_json(output) is None
+        assert OutputParser.try_parse_json(output.encode()) is None
+
+        result = ExecutionResult(exit_code=0, stdout=output, stderr="", success=True)
+        assert OutputParser.parse(result, platform_info).parsed_data is None
+
+    def test_try_parse_json_bytes(self):
+        """Test JSON parsing from raw stdout bytes."""
+        assert OutputParser.try_parse_json(b'{"key": "value"}\n') == {"key": "value"}
+        assert OutputParser.try_parse_json(b'text {"key": 1} text') == {"key": 1}
+
+    def test_try_parse_json_matches_stdlib(self):
+        """Test that large integers and NaN parse as json.loads would."""
+        big = '{"n": 18446744073709551616}'
+        assert OutputParser.try_parse_json(big) == {"n": 18446744073709551616}
+        assert OutputParser.try_parse_json(big.encode()) == {"n": 18446744073709551616}
+
+        result = OutputParser.try_parse_json('{"x": NaN}')
+        assert result is not None and math.isnan(result["x"])
+
+    def test_contains_any(self):
+        """Test finding several substrings in a text at once."""
+        text = "Hello World\nbuild OK"
+
+        assert OutputParser.contains_any(text, ["hello", "OK", "fail"]) == {"OK"}
+        assert OutputParser.contains_any(
+            text, ["hello", "WORLD", "fail"], ignore_case=True
+        ) == {"hello", "WORLD"}
+        assert OutputParser.contains_any(text, []) == set()
+
     def test_extract_key_value_pairs(self):
         """Test extracting key-value pairs."""
         output = """
@@ -109,6 +187,13 @@ KEY3 = value3
         assert pairs.get("KEY2") == "value2"
         assert pairs.get("KEY3") == "value3"
 
+    def test_extract_key_value_pairs_long_blank_run(self):
+        """Test key-value extraction on a value with a long run of blanks."""
+        output = "KEY=a" + " " * 20000 + "b  \n"
+        pairs = OutputParser.extract_key_value_pairs(output)
+
+        assert pairs["KEY"] == "a" + " " * 20000 + "b"
+
     def test_extract_table_pipe_separated(self):
         """Test extracting pipe-separated table data."""
         output = """
@@ -124,6 +209,45 @@ KEY3 = value3
         assert tables[0]["Age"] == "30"
         assert tables[1]["Name"] == "Jane"
 
+    def test_extract_table_whitespace_separated(self):
+        """Test extracting whitespace-separated table data."""
+        output = """
+NAME    STATUS   AGE
+----    ------   ---
+web-1   Running  5d
+db-1    Pending  1h
+"""
+        tables = OutputParser.extract_table(output)
+
+        assert tables == [
+            {"NAME": "web-1", "STATUS": "Running", "AGE": "5d"},
+            {"NAME": "db-1", "STATUS": "Pending", "AGE": "1h"},
+        ]
+
+    def test_extract_table_markdown_alignment(self):
+        """Test extracting a pipe table with alignment markers."""
+        output = """
+| Name | Age |
+|:-----|----:|
+| John | 30  |
+"""
+        tables = OutputParser.extract_table(output)
+
+        assert tables == [{"Name": "John", "Age": "30"}]
+
+    def test_extract_table_aligned_rows_match_split(self):
+        """Test that aligned rows with stray pipes are dropped like unaligned ones."""
+        output = """
+| h1 | h2  |
+|----+-----|
+| a|b| c   |
+| a  + b   |
+| x  | y   |
+"""
+        tables = OutputParser.extract_table(output)
+
+        assert tables == [{"h1": "x", "h2": "y"}]
+
     def test_format_summary(self, success_result, platform_info):
         """Test formatting a result summary."""
         parsed = OutputParser.parse(success_result, platform_info)
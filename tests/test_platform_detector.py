@@ -1,5 +1,7 @@
 """Tests for the platform detector module."""
 
+import shutil
+
 import pytest
 from bash_skill.platform_detector import PlatformDetector, PlatformInfo
 
@@ -7,6 +9,13 @@ from bash_skill.platform_detector import PlatformDetector, PlatformInfo
 class TestPlatformDetector:
     """Test cases for PlatformDetector."""
 
+    @pytest.fixture(autouse=True)
+    def clear_detection_cache(self):
+        """Clear cached detection results around each test."""
+        PlatformDetector.invalidate_cache()
+        yield
+        PlatformDetector.invalidate_cache()
+
     def test_detect_returns_platform_info(self):
         """Test that detect returns a valid PlatformInfo object."""
         info = PlatformDetector.detect()
@@ -18,7 +27,7 @@ class TestPlatformDetector:
 
     def test_detect_windows(self, monkeypatch):
         """Test detection of Windows platform."""
-        monkeypatch.setattr("platform.system", lambda: "Windows")
+        monkeypatch.setattr("bash_skill.platform_detector._SYSTEM_NAME", "Windows")
 
         info = PlatformDetector.detect()
 
@@ -28,7 +37,7 @@ class TestPlatformDetector:
 
     def test_detect_linux(self, monkeypatch):
         """Test detection of Linux platform."""
-        monkeypatch.setattr("platform.system", lambda: "Linux")
+        monkeypatch.setattr("bash_skill.platform_detector._SYSTEM_NAME", "Linux")
         monkeypatch.setattr("shutil.which", lambda x: "bash" if x == "bash" else None)
 
         info = PlatformDetector.detect()
@@ -39,7 +48,7 @@ class TestPlatformDetector:
 
     def test_detect_darwin(self, monkeypatch):
         """Test detection of macOS (Darwin) platform."""
-        monkeypatch.setattr("platform.system", lambda: "Darwin")
+        monkeypatch.setattr("bash_skill.platform_detector._SYSTEM_NAME", "Darwin")
         monkeypatch.setattr("shutil.which", lambda x: "zsh" if x == "zsh" else ("bash" if x == "bash" else None))
 
         info = PlatformDetector.detect()
@@ -91,3 +100,33 @@ class TestPlatformDetector:
         for shell, available in shells.items():
             assert isinstance(shell, str)
             assert isinstance(available, bool)
+
+    @pytest.mark.parametrize("system", ["Linux", "Windows"])
+    def test_get_available_shells_matches_which(self, system, monkeypatch):
+        """Test shell availability agrees with shutil.which."""
+        monkeypatch.setattr("bash_skill.platform_detector._SYSTEM_NAME", system)
+        shells = PlatformDetector.get_available_shells()
+
+        for shell, available in shells.items():
+            assert available == (shutil.which(shell) is not None)
+
+    def test_get_available_shells_returns_copy(self):
+        """Test that modifying the result does not affect later calls."""
+        shells = PlatformDetector.get_available_shells()
+        shells["bash"] = not shells["bash"]
+        shells["fish"] = True
+
+        assert PlatformDetector.get_available_shells() != shells
+        assert "fish" not in PlatformDetector.get_available_shells()
+
+    def test_detect_is_cached(self):
+        """Test that repeated detection returns the cached result."""
+        assert PlatformDetector.detect() is PlatformDetector.detect()
+
+    def test_invalidate_cache(self, monkeypatch):
+        """Test that invalidating the cache re-runs detection."""
+        PlatformDetector.detect()
+        monkeypatch.setattr("bash_skill.platform_detector._SYSTEM_NAME", "Windows")
+        PlatformDetector.invalidate_cache()
+
+        assert PlatformDetector.detect().system == "Windows"
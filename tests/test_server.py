@@ -1,7 +1,11 @@
 """Tests for the MCP server module."""
 
+import os
+
 import pytest
-from bash_skill.server import mcp, execute_command, get_shell_info, execute_batch, _get_executor
+from bash_skill.server import (
+    mcp, execute_command, get_shell_info, execute_batch, _get_executor, _batch_concurrency
+)
 
 
 class TestMCPServer:
@@ -45,6 +49,32 @@ class TestMCPServer:
         assert len(results) == 2
         assert all("hello" in r.stdout.lower() or "world" in r.stdout.lower() for r in results)
 
+    @pytest.mark.asyncio
+    async def test_execute_batch_parallel(self):
+        """Test parallel batch execution keeps command order."""
+        results = await execute_batch(
+            commands=["echo hello", "invalid_command_xyz_12345", "echo world"],
+            parallel=True,
+        )
+
+        assert len(results) == 3
+        assert "hello" in results[0].stdout.lower()
+        assert results[1].success is False
+        assert "world" in results[2].stdout.lower()
+
+    def test_batch_concurrency_from_env(self, monkeypatch):
+        """Test parsing of BASH_SKILL_BATCH_CONCURRENCY."""
+        default = os.cpu_count() or 4
+
+        monkeypatch.setenv("BASH_SKILL_BATCH_CONCURRENCY", "3")
+        assert _batch_concurrency() == 3
+        monkeypatch.setenv("BASH_SKILL_BATCH_CONCURRENCY", "")
+        assert _batch_concurrency() == default
+        monkeypatch.setenv("BASH_SKILL_BATCH_CONCURRENCY", "0")
+        assert _batch_concurrency() == 1
+        monkeypatch.delenv("BASH_SKILL_BATCH_CONCURRENCY")
+        assert _batch_concurrency() == default
+
     @pytest.mark.asyncio
     async def test_execute_with_timeout(self):
         """Test command with timeout."""